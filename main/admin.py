@@ -3,6 +3,18 @@ from django.contrib import admin
 from .models import AddOn, Amenity, Booking, Review, Venue, VenueCategory, VenueImage, WishlistItem
 
 
+class ChangelistOnlyMixin:
+    changelist_only = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        # Only trim columns on the changelist; the change form renders every field.
+        if self.changelist_only and match and match.url_name.endswith("_changelist"):
+            queryset = queryset.only(*self.changelist_only)
+        return queryset
+
+
 @admin.register(VenueCategory)
 class VenueCategoryAdmin(admin.ModelAdmin):
     list_display = ("name", "slug", "created_at")
@@ -25,10 +37,12 @@ class AddOnInline(admin.TabularInline):
 
 
 @admin.register(Venue)
-class VenueAdmin(admin.ModelAdmin):
+class VenueAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ("name", "city", "category", "price_per_hour", "capacity")
+    changelist_only = ("name", "slug", "city", "category__name", "price_per_hour", "capacity")
     search_fields = ("name", "city", "category__name")
     list_filter = ("category", "city")
+    list_select_related = ("category",)
     prepopulated_fields = {"slug": ("name",)}
     inlines = [VenueImageInline, AddOnInline]
     filter_horizontal = ("amenities",)
@@ -42,6 +56,7 @@ class VenueImageAdmin(admin.ModelAdmin):
 @admin.register(WishlistItem)
 class WishlistItemAdmin(admin.ModelAdmin):
     list_display = ("user", "venue", "created_at")
+    list_select_related = ("venue", "user")
     search_fields = ("user__username", "venue__name")
 
 
@@ -49,25 +64,42 @@ class BookingAddOnInline(admin.TabularInline):
     model = Booking.add_ons.through
     extra = 1
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("addon__venue")
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # AddOn.__str__ includes the venue name, so join it for the choice labels.
+        if db_field.name == "addon":
+            kwargs["queryset"] = AddOn.objects.select_related("venue")
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
 
 @admin.register(Booking)
-class BookingAdmin(admin.ModelAdmin):
+class BookingAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ("venue", "user", "date", "start_time", "end_time", "status")
+    changelist_only = ("venue__name", "user__username", "date", "start_time", "end_time", "status")
     list_filter = ("status", "venue", "date")
+    list_select_related = ("venue", "user")
     search_fields = ("venue__name", "user__username")
     inlines = [BookingAddOnInline]
     exclude = ("add_ons",)
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("venue", "user")
+
 
 @admin.register(AddOn)
 class AddOnAdmin(admin.ModelAdmin):
     list_display = ("name", "venue", "price")
+    list_select_related = ("venue",)
     list_filter = ("venue",)
     search_fields = ("name", "venue__name")
 
 
 @admin.register(Review)
-class ReviewAdmin(admin.ModelAdmin):
+class ReviewAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     list_display = ("venue", "user", "rating", "created_at")
+    changelist_only = ("venue__name", "user__username", "rating", "created_at")
     list_filter = ("rating", "venue")
+    list_select_related = ("venue", "user")
     search_fields = ("venue__name", "user__username", "comment")
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from datetime import date, datetime
-
 from datetime import date
 
 from django import forms
 from django.contrib.auth.forms import AuthenticationForm, UserCreationForm
 from django.contrib.auth.models import User
+from django.core.cache import cache
 
 from .models import AddOn, Booking, Review, Venue, VenueCategory
 
+VENUE_FILTER_CITIES_CACHE_KEY = "venue_filter_cities"
+VENUE_FILTER_CATEGORIES_CACHE_KEY = "venue_filter_categories"
+VENUE_FILTER_CACHE_TIMEOUT = 300
+
 
 class LoginForm(AuthenticationForm):
     username = forms.EmailField(
@@ -103,8 +106,9 @@ class RegistrationForm(UserCreationForm):
 
     def save(self, commit: bool = True):
         user: User = super().save(commit=False)
-        user.username = self.cleaned_data["email"].lower()
-        user.email = self.cleaned_data["email"].lower()
+        email = self.cleaned_data["email"]
+        user.username = email
+        user.email = email
         user.first_name = self.cleaned_data.get("first_name", "")
         user.last_name = self.cleaned_data.get("last_name", "")
         if commit:
@@ -139,10 +143,18 @@ class VenueFilterForm(forms.Form):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        cities = Venue.objects.order_by("city").values_list("city", flat=True).distinct()
-        city_choices = [("", "All Cities"), *[(city, city) for city in cities if city]]
-        categories = VenueCategory.objects.order_by("name").values_list("slug", "name")
-        category_choices = [("", "All Categories"), *list(categories)]
+        cities = cache.get_or_set(
+            VENUE_FILTER_CITIES_CACHE_KEY,
+            lambda: list(Venue.objects.exclude(city="").order_by("city").values_list("city", flat=True).distinct()),
+            VENUE_FILTER_CACHE_TIMEOUT,
+        )
+        city_choices = [("", "All Cities"), *[(city, city) for city in cities]]
+        categories = cache.get_or_set(
+            VENUE_FILTER_CATEGORIES_CACHE_KEY,
+            lambda: list(VenueCategory.objects.order_by("name").values_list("slug", "name")),
+            VENUE_FILTER_CACHE_TIMEOUT,
+        )
+        category_choices = [("", "All Categories"), *categories]
         self.fields["city"].choices = city_choices
         self.fields["category"].choices = category_choices
         for name in ("q", "city", "category", "max_price"):
@@ -155,7 +167,7 @@ class VenueFilterForm(forms.Form):
 
 class BookingForm(forms.ModelForm):
     date = forms.DateField(
-        widget=forms.DateInput(attrs={"type": "date", "min": date.today().isoformat()}),
+        widget=forms.DateInput(attrs={"type": "date"}),
     )
     start_time = forms.TimeField(widget=forms.TimeInput(attrs={"type": "time"}))
     end_time = forms.TimeField(widget=forms.TimeInput(attrs={"type": "time"}))
@@ -202,8 +214,7 @@ class BookingForm(forms.ModelForm):
                     venue=self.venue,
                     date=booking_date,
                 )
-                .exclude(status=Booking.Status.CANCELLED)
-                .exclude(status=Booking.Status.REJECTED)
+                .exclude(status__in=[Booking.Status.CANCELLED, Booking.Status.REJECTED])
                 .filter(start_time__lt=end, end_time__gt=start)
             )
             if overlapping.exists():
@@ -230,8 +241,8 @@ class ReviewForm(forms.ModelForm):
         }
 
     def clean_rating(self):
-        rating = self.cleaned_data.get("rating")
-        if rating not in range(1, 6):
+        rating = self.cleaned_data.get("rating") or 0
+        if not 1 <= rating <= 5:
             raise forms.ValidationError("Please choose a rating between 1 and 5.")
         return rating
 
@@ -0,0 +1,10 @@
+from django.utils import timezone
+
+
+class TodayMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.today = timezone.localdate()
+        return self.get_response(request)
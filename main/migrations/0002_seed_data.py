@@ -1,4 +1,5 @@
 from django.db import migrations
+from django.utils.text import slugify
 
 
 def create_seed_data(apps, schema_editor):
@@ -8,24 +9,31 @@ def create_seed_data(apps, schema_editor):
     VenueImage = apps.get_model('main', 'VenueImage')
     AddOn = apps.get_model('main', 'AddOn')
 
-    categories = {
-        'futsal': VenueCategory.objects.create(name='Futsal Arena'),
-        'basketball': VenueCategory.objects.create(name='Basketball Court'),
-        'badminton': VenueCategory.objects.create(name='Badminton Hall'),
-    }
+    category_specs = [
+        ('futsal', 'Futsal Arena'),
+        ('basketball', 'Basketball Court'),
+        ('badminton', 'Badminton Hall'),
+    ]
+    VenueCategory.objects.bulk_create(
+        [VenueCategory(name=name, slug=slugify(name)) for _, name in category_specs],
+        ignore_conflicts=True,
+    )
+    categories_by_slug = VenueCategory.objects.in_bulk(
+        [slugify(name) for _, name in category_specs], field_name='slug'
+    )
+    categories = {key: categories_by_slug[slugify(name)] for key, name in category_specs}
 
-    amenities = {
-        name: Amenity.objects.create(name=name)
-        for name in [
-            'Locker Room',
-            'Shower Facility',
-            'Scoreboard',
-            'Premium Lighting',
-            'Hydration Station',
-            'Coaching Bench',
-            'Medical Kit',
-        ]
-    }
+    amenity_names = [
+        'Locker Room',
+        'Shower Facility',
+        'Scoreboard',
+        'Premium Lighting',
+        'Hydration Station',
+        'Coaching Bench',
+        'Medical Kit',
+    ]
+    Amenity.objects.bulk_create([Amenity(name=name) for name in amenity_names], ignore_conflicts=True)
+    amenities = Amenity.objects.in_bulk(amenity_names, field_name='name')
 
     venues_data = [
         {
@@ -90,23 +98,52 @@ def create_seed_data(apps, schema_editor):
         },
     ]
 
+    Venue.objects.bulk_create(
+        [
+            Venue(
+                name=data['name'],
+                slug=slugify(data['name']),
+                city=data['city'],
+                address=data['address'],
+                category=data['category'],
+                price_per_hour=data['price_per_hour'],
+                capacity=data['capacity'],
+                hero_image=data['hero_image'],
+                description=data['description'],
+                highlights=data['highlights'],
+            )
+            for data in venues_data
+        ],
+        ignore_conflicts=True,
+    )
+    venues = Venue.objects.in_bulk([slugify(data['name']) for data in venues_data], field_name='slug')
+
+    # Gallery images have no natural key, so skip the ones a previous run already stored.
+    existing_images = set(
+        VenueImage.objects.filter(venue__in=venues.values()).values_list('venue_id', 'image_url')
+    )
+
+    VenueAmenity = Venue.amenities.through
+    amenity_links = []
+    images = []
+    add_ons = []
     for data in venues_data:
-        venue = Venue.objects.create(
-            name=data['name'],
-            city=data['city'],
-            address=data['address'],
-            category=data['category'],
-            price_per_hour=data['price_per_hour'],
-            capacity=data['capacity'],
-            hero_image=data['hero_image'],
-            description=data['description'],
-            highlights=data['highlights'],
+        venue = venues[slugify(data['name'])]
+        amenity_links.extend(
+            VenueAmenity(venue_id=venue.pk, amenity_id=amenities[name].pk) for name in data['amenities']
+        )
+        images.extend(
+            VenueImage(venue=venue, image_url=image)
+            for image in data['images']
+            if (venue.pk, image) not in existing_images
+        )
+        add_ons.extend(
+            AddOn(venue=venue, name=name, price=price, description=description)
+            for name, price, description in data['add_ons']
         )
-        venue.amenities.set([amenities[name] for name in data['amenities']])
-        for image in data['images']:
-            VenueImage.objects.create(venue=venue, image_url=image)
-        for name, price, description in data['add_ons']:
-            AddOn.objects.create(venue=venue, name=name, price=price, description=description)
+    VenueAmenity.objects.bulk_create(amenity_links, ignore_conflicts=True)
+    VenueImage.objects.bulk_create(images)
+    AddOn.objects.bulk_create(add_ons, ignore_conflicts=True)
 
 
 def delete_seed_data(apps, schema_editor):
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0002_seed_data"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(fields=["venue", "date"], name="bk_venue_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["venue", "date", "start_time"], name="bk_venue_date_start_idx"
+            ),
+        ),
+    ]
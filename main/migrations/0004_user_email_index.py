@@ -0,0 +1,29 @@
+from django.conf import settings
+from django.db import migrations, models
+
+# auth.User belongs to django.contrib.auth, so main cannot declare the index in
+# migration state (AddIndex only targets this app's models); the schema editor
+# creates it directly instead.
+USER_EMAIL_INDEX = models.Index(fields=['email'], name='user_email_idx')
+
+
+def add_user_email_index(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    schema_editor.add_index(User, USER_EMAIL_INDEX)
+
+
+def remove_user_email_index(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    schema_editor.remove_index(User, USER_EMAIL_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0003_booking_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(add_user_email_index, remove_user_email_index),
+    ]
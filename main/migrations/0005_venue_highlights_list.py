@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:29
+
+from django.db import migrations, models
+
+
+def populate_highlights_list(apps, schema_editor):
+    Venue = apps.get_model("main", "Venue")
+    venues = list(Venue.objects.only("pk", "highlights"))
+    for venue in venues:
+        venue.highlights_list = [
+            item.strip() for item in venue.highlights.split(",") if item.strip()
+        ]
+    Venue.objects.bulk_update(venues, ["highlights_list"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0004_user_email_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="venue",
+            name="highlights_list",
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(populate_highlights_list, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0005_venue_highlights_list"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="venue",
+            index=models.Index(
+                fields=["city", "category"], name="venue_city_category_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+# Must match VENUE_SEARCH_VECTOR in main.models so the planner can use the index.
+VENUE_SEARCH_INDEX = GinIndex(
+    SearchVector('name', 'city', 'description', config='english'),
+    name='venue_search_gin',
+)
+
+
+def add_venue_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Venue = apps.get_model('main', 'Venue')
+    schema_editor.add_index(Venue, VENUE_SEARCH_INDEX)
+
+
+def remove_venue_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Venue = apps.get_model('main', 'Venue')
+    schema_editor.remove_index(Venue, VENUE_SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_venue_city_category_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_venue_search_index, remove_venue_search_index),
+    ]
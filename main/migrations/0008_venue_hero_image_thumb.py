@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:31
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from django.db import migrations, models
+
+
+def populate_hero_image_thumb(apps, schema_editor):
+    Venue = apps.get_model("main", "Venue")
+    venues = list(Venue.objects.only("pk", "hero_image"))
+    for venue in venues:
+        parts = urlsplit(venue.hero_image)
+        if parts.netloc == "images.unsplash.com":
+            query = dict(parse_qsl(parts.query))
+            query["w"] = "400"
+            venue.hero_image_thumb = urlunsplit(parts._replace(query=urlencode(query)))
+        else:
+            venue.hero_image_thumb = venue.hero_image
+    Venue.objects.bulk_update(venues, ["hero_image_thumb"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0007_venue_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="venue",
+            name="hero_image_thumb",
+            field=models.URLField(blank=True, editable=False),
+        ),
+        migrations.RunPython(populate_hero_image_thumb, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:34
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_bookings_count(apps, schema_editor):
+    Venue = apps.get_model("main", "Venue")
+    Booking = apps.get_model("main", "Booking")
+    counts = (
+        Booking.objects.filter(venue=OuterRef("pk"))
+        .order_by()
+        .values("venue")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Venue.objects.update(bookings_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0010_booking_review_checks"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="venue",
+            name="bookings_count",
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(populate_bookings_count, migrations.RunPython.noop),
+    ]
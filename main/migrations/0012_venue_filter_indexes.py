@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:40
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0011_venue_bookings_count"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="venue",
+            index=models.Index(
+                django.db.models.functions.text.Upper("city"),
+                name="venue_city_upper_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="venue",
+            index=models.Index(fields=["price_per_hour"], name="venue_price_idx"),
+        ),
+    ]
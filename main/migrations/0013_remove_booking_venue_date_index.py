@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:46
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0012_venue_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="booking",
+            name="bk_venue_date_idx",
+        ),
+    ]
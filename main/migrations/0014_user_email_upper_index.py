@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+# Like 0004, these indexes live on the contrib auth table, which main's migration
+# state cannot describe, so the schema editor manages them directly.
+USER_EMAIL_INDEX = models.Index(fields=['email'], name='user_email_idx')
+# email__iexact compiles to UPPER(email) = UPPER(%s) on PostgreSQL.
+USER_EMAIL_UPPER_INDEX = models.Index(Upper('email'), name='user_email_upper_idx')
+
+
+def swap_to_upper_index(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    schema_editor.remove_index(User, USER_EMAIL_INDEX)
+    schema_editor.add_index(User, USER_EMAIL_UPPER_INDEX)
+
+
+def swap_to_plain_index(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    schema_editor.remove_index(User, USER_EMAIL_UPPER_INDEX)
+    schema_editor.add_index(User, USER_EMAIL_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0013_remove_booking_venue_date_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(swap_to_upper_index, swap_to_plain_index),
+    ]
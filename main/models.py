@@ -2,11 +2,18 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from django.conf import settings
-from django.db import models
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models import Avg, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Upper
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 
 
@@ -45,6 +52,55 @@ class Amenity(TimeStampedModel):
         return self.name
 
 
+def split_highlights(highlights: str) -> list[str]:
+    if not highlights:
+        return []
+    return [item.strip() for item in highlights.split(",") if item.strip()]
+
+
+VENUE_THUMBNAIL_WIDTH = 400
+
+
+def thumbnail_url(url: str, width: int = VENUE_THUMBNAIL_WIDTH) -> str:
+    parts = urlsplit(url)
+    if parts.netloc != "images.unsplash.com":
+        return url
+    query = dict(parse_qsl(parts.query))
+    query["w"] = str(width)
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+VENUE_URL_SLUG_PLACEHOLDER = "__slug__"
+
+
+@lru_cache(maxsize=1)
+def venue_url_template() -> str:
+    # Resolved once per process; the venue_detail route has a single slug segment.
+    return reverse("venue_detail", args=[VENUE_URL_SLUG_PLACEHOLDER])
+
+
+VENUE_SEARCH_VECTOR = SearchVector("name", "city", "description", config="english")
+
+
+class VenueQuerySet(models.QuerySet):
+    def with_ratings(self):
+        # A correlated subquery keeps the outer query free of a reviews JOIN and GROUP BY.
+        reviews = Review.objects.filter(venue=OuterRef("pk")).order_by().values("venue")
+        return self.annotate(avg_rating=Subquery(reviews.annotate(value=Avg("rating")).values("value")))
+
+    def search(self, query: str):
+        # Full-text search is backed by the GIN index from migration 0007, which only
+        # exists on PostgreSQL; other backends keep the plain name lookup.
+        if connections[self.db].vendor != "postgresql":
+            return self.filter(name__icontains=query)
+        search_query = SearchQuery(query, config="english")
+        return (
+            self.annotate(search=VENUE_SEARCH_VECTOR, search_rank=SearchRank(VENUE_SEARCH_VECTOR, search_query))
+            .filter(search=search_query)
+            .order_by("-search_rank", "name")
+        )
+
+
 class Venue(TimeStampedModel):
     name = models.CharField(max_length=150)
     slug = models.SlugField(max_length=170, unique=True, blank=True)
@@ -54,40 +110,65 @@ class Venue(TimeStampedModel):
     price_per_hour = models.DecimalField(max_digits=10, decimal_places=2)
     capacity = models.PositiveIntegerField(default=10)
     hero_image = models.URLField(help_text="Main hero image for the venue")
+    hero_image_thumb = models.URLField(blank=True, editable=False)
     description = models.TextField()
     highlights = models.TextField(blank=True, help_text="Comma separated bullet points")
+    highlights_list = models.JSONField(default=list, blank=True, editable=False)
     amenities = models.ManyToManyField(Amenity, related_name="venues", blank=True)
+    bookings_count = models.PositiveIntegerField(default=0, db_index=True, editable=False)
+
+    objects = VenueQuerySet.as_manager()
 
     class Meta:
         ordering = ("name",)
+        indexes = [
+            models.Index(fields=["city", "category"], name="venue_city_category_idx"),
+            # city__iexact compiles to UPPER(city) = UPPER(%s) on PostgreSQL.
+            models.Index(Upper("city"), name="venue_city_upper_idx"),
+            models.Index(fields=["price_per_hour"], name="venue_price_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - simple representation
         return self.name
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            base_slug = slugify(self.name)
-            slug = base_slug
-            counter = 1
-            while Venue.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                counter += 1
-                slug = f"{base_slug}-{counter}"
+        self.highlights_list = split_highlights(self.highlights)
+        self.hero_image_thumb = thumbnail_url(self.hero_image)
+        if self.slug:
+            super().save(*args, **kwargs)
+            return
+        base_slug = slugify(self.name)
+        taken = set(
+            Venue.objects.filter(slug__startswith=base_slug).exclude(pk=self.pk).values_list("slug", flat=True)
+        )
+        counter = 1
+        while True:
+            slug = base_slug if counter == 1 else f"{base_slug}-{counter}"
+            counter += 1
+            if slug in taken:
+                continue
             self.slug = slug
-        super().save(*args, **kwargs)
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                # Another writer claimed the slug between our lookup and insert.
+                if not Venue.objects.filter(slug=slug).exclude(pk=self.pk).exists():
+                    self.slug = ""
+                    raise
+                taken.add(slug)
 
     def get_absolute_url(self) -> str:
-        return reverse("venue_detail", args=[self.slug])
+        return venue_url_template().replace(VENUE_URL_SLUG_PLACEHOLDER, self.slug)
 
     def highlight_items(self) -> list[str]:
-        if not self.highlights:
-            return []
-        return [item.strip() for item in self.highlights.split(",") if item.strip()]
+        return self.highlights_list
 
-    def average_rating(self) -> Decimal | None:
-        ratings = self.reviews.all().values_list("rating", flat=True)
-        if not ratings:
-            return None
-        return sum(Decimal(rating) for rating in ratings) / Decimal(len(ratings))
+    def average_rating(self) -> float | None:
+        if hasattr(self, "avg_rating"):
+            return self.avg_rating
+        return self.reviews.aggregate(avg=Avg("rating"))["avg"]
 
 
 class VenueImage(TimeStampedModel):
@@ -148,6 +229,12 @@ class Booking(TimeStampedModel):
 
     class Meta:
         ordering = ("-date", "start_time")
+        indexes = [
+            models.Index(fields=["venue", "date", "start_time"], name="bk_venue_date_start_idx"),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=Q(start_time__lt=F("end_time")), name="booking_time_order"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover
         return f"{self.venue.name} on {self.date}"
@@ -159,26 +246,29 @@ class Booking(TimeStampedModel):
             event_datetime = timezone.make_aware(event_datetime, timezone.get_current_timezone())
         return event_datetime >= timezone.now()
 
+    @cached_property
     def total_price(self) -> Decimal:
-        start = datetime.combine(self.date, self.start_time)
-        end = datetime.combine(self.date, self.end_time)
-        duration = (end - start).total_seconds() / 3600
-        duration_hours = Decimal(str(duration)).quantize(Decimal("0.01"))
-        base_price = (self.venue.price_per_hour * duration_hours).quantize(Decimal("0.01"))
-        add_on_total = sum((add_on.price for add_on in self.add_ons.all()), Decimal("0.00"))
+        start_minutes = self.start_time.hour * 60 + self.start_time.minute
+        end_minutes = self.end_time.hour * 60 + self.end_time.minute
+        base_price = (self.venue.price_per_hour * (end_minutes - start_minutes) / 60).quantize(Decimal("0.01"))
+        if "add_ons" in getattr(self, "_prefetched_objects_cache", {}):
+            add_on_total = sum((add_on.price for add_on in self.add_ons.all()), Decimal("0.00"))
+        else:
+            add_on_total = self.add_ons.aggregate(total=Sum("price"))["total"] or Decimal("0.00")
         return base_price + add_on_total
 
 
 class Review(TimeStampedModel):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="reviews")
     venue = models.ForeignKey(Venue, on_delete=models.CASCADE, related_name="reviews")
-    rating = models.PositiveSmallIntegerField()
+    rating = models.PositiveSmallIntegerField(validators=[MinValueValidator(1), MaxValueValidator(5)])
     comment = models.TextField()
 
     class Meta:
         ordering = ("-created_at",)
         constraints = [
             models.UniqueConstraint(fields=("user", "venue"), name="unique_review_per_user"),
+            models.CheckConstraint(condition=Q(rating__gte=1, rating__lte=5), name="review_rating_range"),
         ]
 
     def __str__(self) -> str:  # pragma: no cover
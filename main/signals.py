@@ -0,0 +1,28 @@
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .forms import VENUE_FILTER_CATEGORIES_CACHE_KEY, VENUE_FILTER_CITIES_CACHE_KEY
+from .models import Booking, Venue, VenueCategory
+
+
+@receiver([post_save, post_delete], sender=Venue)
+def clear_venue_filter_cities(sender, **kwargs):
+    cache.delete(VENUE_FILTER_CITIES_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=VenueCategory)
+def clear_venue_filter_categories(sender, **kwargs):
+    cache.delete(VENUE_FILTER_CATEGORIES_CACHE_KEY)
+
+
+@receiver(post_save, sender=Booking)
+def increment_venue_bookings_count(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        Venue.objects.filter(pk=instance.venue_id).update(bookings_count=F("bookings_count") + 1)
+
+
+@receiver(post_delete, sender=Booking)
+def decrement_venue_bookings_count(sender, instance, **kwargs):
+    Venue.objects.filter(pk=instance.venue_id, bookings_count__gt=0).update(bookings_count=F("bookings_count") - 1)
@@ -1,18 +1,38 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from hashlib import md5
+from pathlib import Path
+
+from django.conf import settings
 from django.contrib import messages
-from django.contrib.auth import login
+from django.contrib.auth import get_user_model, login
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.views import LoginView
-from django.db.models import Count
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Exists, F, Max, OuterRef, Prefetch, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse_lazy
-from django.utils import timezone
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from django.views.generic import DetailView, FormView, TemplateView
 
 from .forms import BookingForm, LoginForm, RegistrationForm, ReviewForm, VenueFilterForm
-from .models import Booking, Review, Venue, WishlistItem
+from .models import Booking, Review, Venue, VenueCategory, WishlistItem
+
+
+def _render_venue_detail(request, venue, *, booking_form=None, review_form=None):
+    context = {
+        "object": venue,
+        "booking_form": booking_form if booking_form is not None else BookingForm(venue),
+        "review_form": review_form if review_form is not None else ReviewForm(),
+        "is_wishlisted": WishlistItem.objects.filter(user=request.user, venue=venue).exists(),
+        "upcoming_bookings": venue.bookings.filter(date__gte=request.today).order_by("date")[:5],
+    }
+    return render(request, "main/venue_detail.html", context)
 
 
 class RagaLoginView(LoginView):
@@ -44,22 +64,77 @@ class LandingView(View):
         return redirect("login")
 
 
+@lru_cache(maxsize=1)
+def page_release() -> str:
+    # Fingerprint of this app's code and the project templates, so a deploy retires old ETags.
+    sources = sorted(Path(__file__).resolve().parent.glob("*.py"))
+    for template_dir in settings.TEMPLATES[0]["DIRS"]:
+        sources += sorted(Path(template_dir).rglob("*.html"))
+    digest = md5(usedforsecurity=False)
+    for source in sources:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def venue_list_etag(request, *args, **kwargs):
+    if not request.user.is_authenticated or len(messages.get_messages(request)):
+        return None
+    venue_state = Venue.objects.aggregate(
+        count=Count("pk"),
+        updated=Max("updated_at"),
+        bookings=Sum("bookings_count"),
+    )
+    # The filter dropdown lists every category, including ones without venues.
+    category_state = VenueCategory.objects.aggregate(count=Count("pk"), updated=Max("updated_at"))
+    wishlist_state = WishlistItem.objects.filter(user=request.user).aggregate(
+        count=Count("pk"),
+        updated=Max("created_at"),
+    )
+    # The CSRF secret rotates on login, so pages carrying a stale token are never reused.
+    key = "|".join(
+        str(part)
+        for part in (
+            page_release(),
+            request.get_full_path(),
+            request.user.pk,
+            request.user.get_username(),
+            request.user.first_name,
+            request.META.get("CSRF_COOKIE"),
+            *venue_state.values(),
+            *category_state.values(),
+            *wishlist_state.values(),
+        )
+    )
+    return md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+@method_decorator([cache_control(private=True, no_cache=True), condition(etag_func=venue_list_etag)], name="dispatch")
 class VenueListBaseView(LoginRequiredMixin, TemplateView):
     template_name = "main/home.html"
+    # Wide columns the venue cards never render.
+    deferred_fields = ("address", "highlights", "highlights_list")
+    _filter_form = None
 
     def get_filter_form(self):
-        return VenueFilterForm(self.request.GET or None)
-
-    def get_queryset(self):
-        queryset = Venue.objects.prefetch_related("amenities").annotate(bookings_count=Count("bookings"))
-        form = self.get_filter_form()
+        if self._filter_form is None:
+            self._filter_form = VenueFilterForm(self.request.GET or None)
+        return self._filter_form
+
+    def get_queryset(self, form):
+        queryset = (
+            Venue.objects.select_related("category")
+            .defer(*self.deferred_fields)
+            .annotate(
+                in_wishlist=Exists(WishlistItem.objects.filter(user=self.request.user, venue=OuterRef("pk")))
+            )
+        )
         if form.is_valid():
             q = form.cleaned_data.get("q")
             city = form.cleaned_data.get("city")
             category = form.cleaned_data.get("category")
             max_price = form.cleaned_data.get("max_price")
             if q:
-                queryset = queryset.filter(name__icontains=q)
+                queryset = queryset.search(q)
             if city:
                 queryset = queryset.filter(city__iexact=city)
             if category:
@@ -72,23 +147,20 @@ class VenueListBaseView(LoginRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
         filter_form = self.get_filter_form()
         context["filter_form"] = filter_form
-        context["venues"] = self.get_queryset()
-        wishlist_ids = set(
-            WishlistItem.objects.filter(user=self.request.user).values_list("venue_id", flat=True)
-        )
-        context["wishlist_ids"] = wishlist_ids
-        context["has_filters"] = any(
-            value for key, value in filter_form.cleaned_data.items() if key != "q"
-        ) if filter_form.is_bound and filter_form.is_valid() else False
+        context["venues"] = self.get_queryset(filter_form)
+        cd = filter_form.cleaned_data if filter_form.is_bound and filter_form.is_valid() else {}
+        context["has_filters"] = bool(cd.get("city") or cd.get("category") or cd.get("max_price"))
         return context
 
 
 class HomeView(VenueListBaseView):
     template_name = "main/home.html"
+    deferred_fields = (*VenueListBaseView.deferred_fields, "description")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["featured_venues"] = context["venues"].order_by("-bookings_count", "name")[:3]
+        # Materialise the slice: home.html reads it twice (hero image and cards).
+        context["featured_venues"] = list(context["venues"].order_by("-bookings_count", "name")[:3])
         return context
 
 
@@ -102,28 +174,51 @@ class VenueDetailView(LoginRequiredMixin, DetailView):
     slug_url_kwarg = "slug"
     template_name = "main/venue_detail.html"
 
+    def get_queryset(self):
+        return (
+            Venue.objects.with_ratings()
+            .select_related("category")
+            .prefetch_related(
+                "amenities",
+                "gallery",
+                "add_ons",
+                Prefetch("reviews", queryset=Review.objects.select_related("user")),
+                Prefetch(
+                    "bookings",
+                    queryset=Booking.objects.filter(date__gte=self.request.today).order_by("date")[:5],
+                    to_attr="upcoming_bookings",
+                ),
+            )
+            .annotate(
+                in_wishlist=Exists(WishlistItem.objects.filter(user=self.request.user, venue=OuterRef("pk")))
+            )
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         venue = self.object
-        context["booking_form"] = BookingForm(venue, self.request.POST or None)
-        context["review_form"] = ReviewForm(self.request.POST or None)
-        context["wishlist_ids"] = set(
-            WishlistItem.objects.filter(user=self.request.user).values_list("venue_id", flat=True)
-        )
-        context["upcoming_bookings"] = venue.bookings.filter(date__gte=timezone.now().date()).order_by("date")[:5]
+        context["booking_form"] = BookingForm(venue)
+        context["review_form"] = ReviewForm()
+        context["is_wishlisted"] = venue.in_wishlist
+        context["upcoming_bookings"] = venue.upcoming_bookings
         return context
 
 
 class WishlistToggleView(LoginRequiredMixin, View):
     def post(self, request, slug):
         venue = get_object_or_404(Venue, slug=slug)
-        wishlist_item, created = WishlistItem.objects.get_or_create(user=request.user, venue=venue)
-        if not created:
-            wishlist_item.delete()
+        deleted, _ = WishlistItem.objects.filter(user=request.user, venue=venue).delete()
+        if deleted:
             messages.info(request, f"Removed {venue.name} from your wishlist.")
         else:
+            try:
+                with transaction.atomic():
+                    WishlistItem.objects.create(user=request.user, venue=venue)
+            except IntegrityError:
+                # A concurrent request already saved it; unique_wishlist_item keeps one row.
+                pass
             messages.success(request, f"Saved {venue.name} to your wishlist.")
-        return redirect(request.POST.get("next", venue.get_absolute_url()))
+        return redirect(request.POST.get("next") or venue.get_absolute_url())
 
 
 class WishlistView(LoginRequiredMixin, TemplateView):
@@ -133,9 +228,18 @@ class WishlistView(LoginRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
         items = (
             WishlistItem.objects.filter(user=self.request.user)
-            .select_related("venue", "venue__category")
-            .prefetch_related("venue__amenities")
             .order_by("-created_at")
+            .values(
+                slug=F("venue__slug"),
+                name=F("venue__name"),
+                city=F("venue__city"),
+                capacity=F("venue__capacity"),
+                price_per_hour=F("venue__price_per_hour"),
+                description=F("venue__description"),
+                hero_image=F("venue__hero_image"),
+                hero_image_thumb=F("venue__hero_image_thumb"),
+                category_name=F("venue__category__name"),
+            )
         )
         context["items"] = items
         return context
@@ -143,25 +247,20 @@ class WishlistView(LoginRequiredMixin, TemplateView):
 
 class BookingCreateView(LoginRequiredMixin, View):
     def post(self, request, slug):
-        venue = get_object_or_404(Venue, slug=slug)
-        form = BookingForm(venue, request.POST)
+        with transaction.atomic():
+            # Serialise the overlap check in BookingForm.clean() and the insert below: a row
+            # lock on backends that support it, BEGIN IMMEDIATE (see settings) on SQLite.
+            venue = get_object_or_404(Venue.objects.select_for_update(), slug=slug)
+            form = BookingForm(venue, request.POST)
+            if form.is_valid():
+                booking: Booking = form.save(commit=False)
+                booking.user = request.user
+                booking.venue = venue
+                booking.save()
+                form.save_m2m()
         if not form.is_valid():
             messages.error(request, "Please correct the highlighted errors before booking.")
-            context = {
-                "object": venue,
-                "booking_form": form,
-                "review_form": ReviewForm(),
-                "wishlist_ids": set(
-                    WishlistItem.objects.filter(user=request.user).values_list("venue_id", flat=True)
-                ),
-                "upcoming_bookings": venue.bookings.filter(date__gte=timezone.now().date()).order_by("date")[:5],
-            }
-            return render(request, "main/venue_detail.html", context)
-        booking: Booking = form.save(commit=False)
-        booking.user = request.user
-        booking.venue = venue
-        booking.save()
-        form.save_m2m()
+            return _render_venue_detail(request, venue, booking_form=form)
         messages.success(
             request,
             "Booking received! We'll confirm availability shortly and notify you via email.",
@@ -175,16 +274,7 @@ class ReviewCreateView(LoginRequiredMixin, View):
         form = ReviewForm(request.POST)
         if not form.is_valid():
             messages.error(request, "Unable to save your review. Please check the form and try again.")
-            context = {
-                "object": venue,
-                "booking_form": BookingForm(venue),
-                "review_form": form,
-                "wishlist_ids": set(
-                    WishlistItem.objects.filter(user=request.user).values_list("venue_id", flat=True)
-                ),
-                "upcoming_bookings": venue.bookings.filter(date__gte=timezone.now().date()).order_by("date")[:5],
-            }
-            return render(request, "main/venue_detail.html", context)
+            return _render_venue_detail(request, venue, review_form=form)
         Review.objects.update_or_create(
             user=request.user,
             venue=venue,
@@ -202,16 +292,21 @@ class ProfileView(LoginRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["upcoming_bookings"] = (
-            self.request.user.bookings.filter(date__gte=timezone.now().date())
-            .select_related("venue")
-            .order_by("date", "start_time")
-        )
-        context["past_bookings"] = (
-            self.request.user.bookings.filter(date__lt=timezone.now().date())
-            .select_related("venue")
-            .order_by("-date")
+        user = self.request.user
+        today = self.request.today
+        bookings = list(user.bookings.select_related("venue").order_by("-date", "-start_time"))
+        context["upcoming_bookings"] = [booking for booking in reversed(bookings) if booking.date >= today]
+        context["past_bookings"] = [booking for booking in bookings if booking.date < today]
+        # Scalar subqueries: joining both relations would count wishlist x reviews rows.
+        wishlist = WishlistItem.objects.filter(user=OuterRef("pk")).order_by().values("user")
+        reviews = Review.objects.filter(user=OuterRef("pk")).order_by().values("user")
+        context.update(
+            get_user_model()
+            .objects.filter(pk=user.pk)
+            .values(
+                wishlist_count=Coalesce(Subquery(wishlist.annotate(count=Count("pk")).values("count")), 0),
+                review_count=Coalesce(Subquery(reviews.annotate(count=Count("pk")).values("count")), 0),
+            )
+            .get()
         )
-        context["wishlist_count"] = self.request.user.wishlist.count()
-        context["review_count"] = self.request.user.reviews.count()
         return context